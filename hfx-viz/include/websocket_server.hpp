@@ -46,7 +46,7 @@ struct WebSocketConfig {
     
     // Performance tuning
     size_t io_thread_pool_size = 4;
-    size_t send_buffer_size = 64 * 1024;  // 64KB
+    size_t send_buffer_size = 64 * 1024;  // 64KB per-client backlog; broadcast frames are dropped above this
     size_t receive_buffer_size = 16 * 1024;  // 16KB
 };
 
@@ -162,6 +162,7 @@ public:
         size_t active_connections = 0;
         size_t total_messages_sent = 0;
         size_t total_messages_received = 0;
+        size_t total_messages_dropped = 0;
         size_t total_bytes_sent = 0;
         size_t total_bytes_received = 0;
         float messages_per_second = 0.0f;
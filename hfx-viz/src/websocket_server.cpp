@@ -244,22 +244,41 @@ void WebSocketServer::disconnect_client(WebSocketConnection::ConnectionId id) {
 }
 
 void WebSocketServer::broadcast_message(const std::vector<uint8_t>& data, MessageType type) {
+    // Frame the payload once (type header + body) and reuse it for every client
+    std::vector<uint8_t> message;
+    message.reserve(data.size() + 1);
+    message.push_back(static_cast<uint8_t>(type));
+    message.insert(message.end(), data.begin(), data.end());
+
     std::lock_guard<std::mutex> lock(s_connections_mutex);
 
+    size_t sent_count = 0;
+    size_t dropped_count = 0;
     for (const auto& [id, conn] : s_connections) {
-        // Add message type header
-        std::vector<uint8_t> message;
-        message.push_back(static_cast<uint8_t>(type));
-        message.insert(message.end(), data.begin(), data.end());
+        // Skip sockets Mongoose is already tearing down
+        if (conn->is_closing || conn->is_draining) {
+            continue;
+        }
+
+        // Backpressure: drop frames of any type (including heartbeats and one-off
+        // market updates) for clients whose backlog exceeds send_buffer_size.
+        // Only periodic METRICS_UPDATE snapshots are superseded by the next tick;
+        // other dropped frames are lost for that client.
+        if (conn->send.len > config_.send_buffer_size) {
+            ++dropped_count;
+            continue;
+        }
 
         mg_ws_send(conn, message.data(), message.size(), WEBSOCKET_OP_BINARY);
+        ++sent_count;
     }
 
     // Update statistics
     {
         std::lock_guard<std::mutex> stats_lock(stats_mutex_);
-        stats_.total_messages_sent += s_connections.size();
-        stats_.total_bytes_sent += data.size() * s_connections.size();
+        stats_.total_messages_sent += sent_count;
+        stats_.total_messages_dropped += dropped_count;
+        stats_.total_bytes_sent += message.size() * sent_count;
     }
 }
 
@@ -322,8 +341,7 @@ std::vector<uint8_t> WebSocketServer::serialize_snapshot(const TelemetryEngine::
     auto metrics_data = serialize_metrics(snapshot.metrics);
     auto market_data = serialize_market_state(snapshot.market_state);
     
-    std::vector<uint8_t> data;
-    data.insert(data.end(), metrics_data.begin(), metrics_data.end());
+    auto data = std::move(metrics_data);
     data.insert(data.end(), market_data.begin(), market_data.end());
     
     return data;